@@ -0,0 +1,96 @@
+#!/usr/bin/env node
+/*
+ * Baileys sidecar for whatsapp_bulk_sender.py --backend protocol.
+ *
+ * Usage: node baileys_sidecar.js <auth_dir>
+ *
+ * Prints {"event": "ready"} on stdout once connected, then reads one JSON
+ * request per line on stdin ({"id", "phone", "message"}) and answers each with
+ * one JSON line ({"id", "ok", "error"}). The login QR code and logs go to
+ * stderr. Closing stdin stops the sidecar.
+ */
+
+const readline = require('readline')
+const pino = require('pino')
+const qrcode = require('qrcode-terminal')
+const {
+  default: makeWASocket,
+  useMultiFileAuthState,
+  DisconnectReason
+} = require('@whiskeysockets/baileys')
+
+const authDir = process.argv[2] || 'baileys-auth'
+// Limit for each WhatsApp call of a send; both together stay below the
+// 60 second SIDECAR_REPLY_TIMEOUT of the Python side
+const CALL_TIMEOUT_MS = 25000
+let sock = null
+let ready = false
+
+function reply (payload) {
+  process.stdout.write(JSON.stringify(payload) + '\n')
+}
+
+async function connect () {
+  const { state, saveCreds } = await useMultiFileAuthState(authDir)
+  sock = makeWASocket({ auth: state, logger: pino({ level: 'silent' }) })
+  sock.ev.on('creds.update', saveCreds)
+
+  sock.ev.on('connection.update', ({ connection, lastDisconnect, qr }) => {
+    if (qr) {
+      qrcode.generate(qr, { small: true }, (code) => process.stderr.write(code + '\n'))
+    }
+    if (connection === 'open' && !ready) {
+      ready = true
+      reply({ event: 'ready' })
+    }
+    if (connection === 'close') {
+      const status = lastDisconnect?.error?.output?.statusCode
+      if (status === DisconnectReason.loggedOut) {
+        process.stderr.write('Logged out, delete the auth directory and scan the QR code again\n')
+        process.exit(1)
+      }
+      // Any other disconnect (including the restart after pairing) reconnects
+      connect()
+    }
+  })
+}
+
+// A call that never settles (e.g. during a reconnect) would otherwise hold up
+// every request queued behind it
+function withTimeout (promise, what) {
+  let timer
+  const timeout = new Promise((resolve, reject) => {
+    timer = setTimeout(() => reject(new Error(`${what} timed out`)), CALL_TIMEOUT_MS)
+  })
+  return Promise.race([promise, timeout]).finally(() => clearTimeout(timer))
+}
+
+async function send ({ id, phone, message }) {
+  try {
+    const [contact] = await withTimeout(sock.onWhatsApp(phone), 'number lookup')
+    if (!contact || !contact.exists) {
+      reply({ id, ok: false, error: 'phone number is not on WhatsApp' })
+      return
+    }
+    // The message may still go out after this times out, so say so in the error
+    await withTimeout(
+      sock.sendMessage(contact.jid, { text: message }),
+      'sending (the message may still be delivered)'
+    )
+    reply({ id, ok: true })
+  } catch (err) {
+    reply({ id, ok: false, error: String(err && err.message ? err.message : err) })
+  }
+}
+
+connect()
+
+// Requests are handled one at a time so replies stay in order
+let pending = Promise.resolve()
+const input = readline.createInterface({ input: process.stdin })
+input.on('line', (line) => {
+  if (!line.trim()) return
+  const request = JSON.parse(line)
+  pending = pending.then(() => send(request))
+})
+input.on('close', () => pending.then(() => process.exit(0)))
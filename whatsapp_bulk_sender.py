@@ -1,41 +1,280 @@
 #!/usr/bin/env python3
 """
 WhatsApp Bulk Messenger
-Automates sending messages to multiple contacts via WhatsApp Web using Selenium.
+Automates sending messages to multiple contacts via WhatsApp Web using Selenium,
+or over the WhatsApp Web protocol through a Baileys sidecar.
 """
 
 import argparse
+import codecs
+import json
+import math
+import queue
+import subprocess
 import time
 import random
+import re
+import socket
+import socketserver
+import stat
 import sys
+import threading
+from abc import ABC, abstractmethod
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, SessionNotCreatedException
+)
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 
 
-class WhatsAppBulkSender:
-    def __init__(self, headless=False):
+# Element locators (data-tab='3' is the search input in the side pane)
+SEARCH_BOX = (By.CSS_SELECTOR, "div[contenteditable='true'][data-tab='3']")
+# Scoped to the conversation footer: a selector list matches in document order,
+# and unscoped alternatives would also match the search box, which comes first
+MESSAGE_BOX = (By.CSS_SELECTOR, "footer div[contenteditable='true']")
+CHAT_TITLE = (By.CSS_SELECTOR, "#main header span[dir='auto']")
+SEARCH_RESULT = (By.CSS_SELECTOR, "div[aria-label='Search results.'] div[role='listitem']")
+# Generic modal container, also used by the "Starting chat" modal while a link loads
+POPUP = (By.CSS_SELECTOR, "div[data-testid='popup-contents']")
+# Text of the dialog shown for a number not on WhatsApp ("Phone number shared via url is invalid.")
+INVALID_NUMBER_TEXT = 'invalid'
+QR_CODE = (By.CSS_SELECTOR, "div[data-ref] canvas")
+
+# Phone numbers in international format, with an optional leading '+'
+PHONE_NUMBER_PATTERN = re.compile(rb'^\+?\d{7,15}$')
+# Formatting characters removed from a number before matching, e.g. '+1 (234) 567-8900'
+PHONE_NUMBER_SEPARATORS = b' -.()'
+
+# Highest code point ChromeDriver can send as a keystroke (emoji lie above it)
+MAX_KEYSTROKE_CODEPOINT = 0xFFFF
+
+# WhatsApp media and profile picture hosts, not needed for sending text
+BLOCKED_URLS = ['*mmg.whatsapp.net*', '*pps.whatsapp.net*']
+
+# Node sidecar speaking the WhatsApp Web protocol through Baileys, and its login state
+DEFAULT_SIDECAR = Path(__file__).resolve().parent / 'sidecar' / 'baileys_sidecar.js'
+DEFAULT_AUTH_DIR = Path.home() / '.cache' / 'wa-bulk' / 'baileys-auth'
+
+# Default send rate: steady messages per minute and how many may go out back to back
+DEFAULT_RATE_PER_MIN = 20
+DEFAULT_BURST = 5
+
+# Chrome profile kept between runs so the WhatsApp Web session survives restarts
+DEFAULT_PROFILE_DIR = Path.home() / '.cache' / 'wa-bulk' / 'profile'
+# ChromeDriver path resolved by webdriver-manager, reused without a version check
+DRIVER_PATH_CACHE = Path.home() / '.cache' / 'wa-bulk' / 'driver_path'
+
+# Timeout in seconds for scanning the QR code at login
+QR_TIMEOUT = 200
+# Timeout in seconds for waiting on chat UI updates
+UI_TIMEOUT = 10
+# Timeout in seconds for a click-to-chat link to boot WhatsApp Web and open the chat
+CHAT_LOAD_TIMEOUT = 60
+# Timeout in seconds for the protocol sidecar to answer a send request
+SIDECAR_REPLY_TIMEOUT = 60
+
+
+class TokenBucket:
+    """Rate limiter allowing bursts of up to `burst` sends, then `rate_per_min` per minute."""
+    
+    def __init__(self, rate_per_min=DEFAULT_RATE_PER_MIN, burst=DEFAULT_BURST):
         """
-        Initialize the WhatsApp Bulk Sender.
+        Initialize the token bucket.
         
         Args:
-            headless (bool): Run browser in headless mode (default: False)
+            rate_per_min (float): Steady number of sends allowed per minute
+            burst (int): Number of sends allowed back to back (the bucket size)
         """
-        self.driver = None
-        self.wait = None
-        self.headless = headless
+        self.rate = rate_per_min / 60
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self):
+        """
+        Take a token, possibly from the future.
+        
+        Returns:
+            float: Seconds the caller must wait before sending (0 if a token was available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance queues callers behind earlier reservations
+            return max(0.0, -self._tokens / self.rate)
+
+
+class BulkSender(ABC):
+    """
+    Common bulk sending loop shared by the sending backends.
+    
+    Subclasses implement `start`, `send_message` and `cleanup`; rate limiting,
+    checkpointing and the summary are handled here.
+    """
+    
+    def __init__(self, rate_limiter=None):
+        """
+        Initialize the bulk sender.
+        
+        Args:
+            rate_limiter (TokenBucket): Limits how fast messages are sent
+                (default: 20 per minute with bursts of 5)
+        """
+        self.rate_limiter = rate_limiter or TokenBucket()
+        # Open checkpoint file during a resumable run, and its write lock
+        self._checkpoint = None
+        self._checkpoint_lock = threading.Lock()
         self.results = {
             'success': [],
             'failed': []
         }
     
+    @abstractmethod
+    def start(self):
+        """
+        Connect to WhatsApp and log in.
+        
+        Returns:
+            bool: True if ready to send, False otherwise
+        """
+    
+    @abstractmethod
+    def send_message(self, phone_number, message):
+        """
+        Send a message to a contact.
+        
+        Args:
+            phone_number (str): Phone number of the recipient
+            message (str): Message to send
+            
+        Returns:
+            bool: True if message sent successfully, False otherwise
+        """
+    
+    def cleanup(self):
+        """Release the resources held by the backend."""
+    
+    def _wait_for_rate_limit(self):
+        """Sleep until the rate limiter allows the next message."""
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            print(f"  Waiting {delay:.1f} seconds before next message...\n")
+            time.sleep(delay)
+    
+    def _send_sequentially(self, phone_numbers, message):
+        """Send messages one recipient at a time."""
+        total = len(phone_numbers)
+        for i, phone_number in enumerate(phone_numbers, 1):
+            phone_number = phone_number.strip()
+            if not phone_number:
+                continue
+            
+            self._wait_for_rate_limit()
+            print(f"[{i}/{total}] Processing {phone_number}...")
+            
+            success = self.send_message(phone_number, message)
+            self._record(phone_number, success)
+    
+    def _record(self, recipient, success):
+        """Store the outcome of a send and append it to the checkpoint file, if any."""
+        self.results['success' if success else 'failed'].append(recipient)
+        
+        if self._checkpoint:
+            entry = {
+                'phone': recipient,
+                'ok': success,
+                'ts': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
+            with self._checkpoint_lock:
+                self._checkpoint.write(json.dumps(entry) + '\n')
+                self._checkpoint.flush()
+    
+    def send_bulk_messages(self, phone_numbers, message, checkpoint_path=None):
+        """
+        Send messages to multiple phone numbers.
+        
+        Messages are spaced by the sender's rate limiter.
+        
+        Args:
+            phone_numbers (list): List of phone numbers
+            message (str): Message to send to all contacts
+            checkpoint_path (str): JSONL file recording each outcome; numbers already
+                sent successfully according to it are skipped (default: None)
+        """
+        if checkpoint_path:
+            sent = read_checkpoint(checkpoint_path)
+            remaining = [number for number in phone_numbers if number.strip() not in sent]
+            if len(remaining) < len(phone_numbers):
+                print(f"✓ Skipping {len(phone_numbers) - len(remaining)} numbers already sent according to '{checkpoint_path}'")
+            phone_numbers = remaining
+            self._checkpoint = open(checkpoint_path, 'a', buffering=1, encoding='utf-8')
+        
+        total = len(phone_numbers)
+        print(f"\n📱 Starting bulk message sending to {total} contacts...")
+        print(f"Message: {message[:50]}{'...' if len(message) > 50 else ''}\n")
+        
+        try:
+            self._send_sequentially(phone_numbers, message)
+        finally:
+            if self._checkpoint:
+                self._checkpoint.close()
+                self._checkpoint = None
+        
+        self.print_summary()
+    
+    def print_summary(self):
+        """Print the success/failure statistics collected so far."""
+        print_results(self.results)
+
+
+class WhatsAppBulkSender(BulkSender):
+    """Sends messages by driving WhatsApp Web in Chrome with Selenium."""
+    
+    def __init__(self, headless=False, fast_type=True, profile_dir=DEFAULT_PROFILE_DIR,
+                 rate_limiter=None, refresh_driver=False):
+        """
+        Initialize the WhatsApp Bulk Sender.
+        
+        Args:
+            headless (bool): Run browser in headless mode (default: False)
+            fast_type (bool): Insert text with a single DevTools command instead
+                of one keystroke per character (default: True)
+            profile_dir (Path): Chrome user data directory that keeps the login
+                between runs (default: ~/.cache/wa-bulk/profile)
+            rate_limiter (TokenBucket): Limits how fast messages are sent
+                (default: 20 per minute with bursts of 5)
+            refresh_driver (bool): Resolve ChromeDriver through webdriver-manager
+                even if a cached path exists (default: False)
+        """
+        super().__init__(rate_limiter)
+        self.driver = None
+        self.qr_wait = None
+        self.short_wait = None
+        self.chat_wait = None
+        self.headless = headless
+        self.fast_type = fast_type
+        self.profile_dir = Path(profile_dir)
+        self.refresh_driver = refresh_driver
+        # Source of keystroke delays, shared by every human_type call
+        self._rng = random.Random()
+        # Cached WebElements, refetched only when they go stale
+        self._message_box = None
+    
+    def start(self):
+        """Start Chrome and log in to WhatsApp Web."""
+        self.setup_driver()
+        return self.open_whatsapp_web()
+    
     def setup_driver(self):
         """Setup Chrome WebDriver with appropriate options."""
         chrome_options = Options()
@@ -47,116 +286,291 @@ class WhatsAppBulkSender:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Skip images, notifications and autoplaying media so chats load faster
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        chrome_options.add_argument('--autoplay-policy=user-gesture-required')
+        
+        # Reuse the saved profile so WhatsApp Web stays logged in
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        chrome_options.add_argument(f'--user-data-dir={self.profile_dir}')
+        chrome_options.add_argument('--profile-directory=Default')
+        
         # Keep browser open for debugging (optional)
         if not self.headless:
             chrome_options.add_experimental_option("detach", True)
         
         # Initialize driver with webdriver-manager for automatic driver setup
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(self._driver_path())
+        try:
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        except SessionNotCreatedException:
+            # The cached driver no longer matches Chrome (e.g. after a browser update)
+            if self.refresh_driver:
+                raise
+            print("⚠ Cached ChromeDriver failed to start Chrome, refreshing it...")
+            self.refresh_driver = True
+            service = Service(self._driver_path())
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Block media downloads (avatars, previews, thumbnails) at the network level
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
         
         # Remove webdriver property to avoid detection
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
-        self.wait = WebDriverWait(self.driver, 200)
+        # Only the login waits for long; everything else fails fast
+        self.qr_wait = WebDriverWait(self.driver, QR_TIMEOUT)
+        self.short_wait = WebDriverWait(self.driver, UI_TIMEOUT)
+        self.chat_wait = WebDriverWait(self.driver, CHAT_LOAD_TIMEOUT)
         print("✓ Chrome WebDriver initialized successfully")
     
+    def _driver_path(self):
+        """Return the ChromeDriver path, resolving it with webdriver-manager only when not cached."""
+        if not self.refresh_driver and DRIVER_PATH_CACHE.exists():
+            driver_path = DRIVER_PATH_CACHE.read_text(encoding='utf-8').strip()
+            # An empty or truncated cache file must not resolve to a directory
+            if driver_path and Path(driver_path).is_file():
+                return driver_path
+        
+        driver_path = ChromeDriverManager().install()
+        DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATH_CACHE.write_text(driver_path, encoding='utf-8')
+        return driver_path
+    
     def open_whatsapp_web(self):
-        """Open WhatsApp Web and wait for QR code scan."""
+        """Open WhatsApp Web and wait for QR code scan if the saved session is missing."""
         print("\nOpening WhatsApp Web...")
         self.driver.get("https://web.whatsapp.com")
         
-        print("Waiting for QR code scan...")
-        print("Please scan the QR code with your WhatsApp mobile app.")
-        
         try:
+            # A saved session goes straight to the chat list, otherwise a QR code is shown
+            element = self.qr_wait.until(EC.any_of(
+                EC.presence_of_element_located(SEARCH_BOX),
+                EC.presence_of_element_located(QR_CODE)
+            ))
+            if element.tag_name != 'canvas':
+                print("✓ Restored saved session. Logged in to WhatsApp Web.")
+                return True
+            
+            print("Waiting for QR code scan...")
+            print("Please scan the QR code with your WhatsApp mobile app.")
+            
             # Wait for the main chat interface to load (indicates successful login)
             # Look for the search box or chat list which appears after login
-            self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true' and @data-tab='3']"))
-            )
+            self.qr_wait.until(EC.presence_of_element_located(SEARCH_BOX))
             print("✓ QR code scanned successfully! Logged in to WhatsApp Web.")
             time.sleep(2)  # Give it a moment to fully load
             return True
         except TimeoutException:
-            print("✗ Timeout: QR code not scanned within 200 seconds.")
+            print(f"✗ Timeout: QR code not scanned within {QR_TIMEOUT} seconds.")
             return False
     
-    def human_type(self, element, text, min_delay=50, max_delay=150):
+    def _resolve(self, attr, locator):
+        """
+        Return the element cached in `attr`, locating it again if missing or stale.
+        
+        Args:
+            attr (str): Name of the attribute holding the cached element
+            locator (tuple): (By, value) pair used to locate the element
+            
+        Returns:
+            WebElement: The cached or freshly located element
+        """
+        element = getattr(self, attr)
+        if element is not None:
+            try:
+                element.is_enabled()
+                return element
+            except StaleElementReferenceException:
+                pass
+        element = self.short_wait.until(EC.presence_of_element_located(locator))
+        setattr(self, attr, element)
+        return element
+    
+    def _composer_empty(self):
+        """
+        Check whether the message composer of the open chat is empty.
+        
+        WhatsApp clears the composer once it has taken a message for sending;
+        a failed Enter leaves the text in place.
+        
+        Returns:
+            bool: True if the composer exists and holds no text
+        """
+        return bool(self.driver.execute_script(
+            "const box = document.querySelector(arguments[0]);"
+            "return box !== null && box.innerText.trim() === '';",
+            MESSAGE_BOX[1]
+        ))
+    
+    def _chat_title(self):
+        """
+        Read the name shown in the header of the open chat.
+        
+        Read in the browser, so a header that is re-rendering while a new chat
+        opens cannot go stale between finding and reading it.
+        
+        Returns:
+            str: Chat name, or None if no chat is open
+        """
+        title = self.driver.execute_script(
+            "const title = document.querySelector(arguments[0]);"
+            "return title && (title.getAttribute('title') || title.innerText);",
+            CHAT_TITLE[1]
+        )
+        return title.strip() if title else None
+    
+    def _invalid_number_shown(self):
+        """
+        Check whether WhatsApp shows its invalid-number dialog.
+        
+        The popup container alone is not enough, since the "Starting chat"
+        modal uses it too; its text must mention the number being invalid.
+        
+        Returns:
+            bool: True if the invalid-number dialog is shown
+        """
+        return bool(self.driver.execute_script(
+            "const popup = document.querySelector(arguments[0]);"
+            "return popup !== null && popup.innerText.toLowerCase().includes(arguments[1]);",
+            POPUP[1],
+            INVALID_NUMBER_TEXT
+        ))
+    
+    def human_type(self, element, text, min_delay=50, max_delay=150, clear=False):
         """
         Type text character by character with random delays to simulate human typing.
         
+        When fast typing is enabled, only the first character is sent as a real
+        keystroke (to focus the element and arm WhatsApp's input handlers) and the
+        rest is inserted with a single DevTools Input.insertText command.
+        
+        ChromeDriver rejects keystrokes outside the Basic Multilingual Plane, so
+        characters such as emoji are always inserted with Input.insertText.
+        
         Args:
             element: Selenium WebElement to type into
             text (str): Text to type
             min_delay (int): Minimum delay between keystrokes in milliseconds
             max_delay (int): Maximum delay between keystrokes in milliseconds
+            clear (bool): Select and delete existing content first (default: False)
         """
-        element.clear()
-        for char in text:
-            element.send_keys(char)
-            # Random delay between keystrokes (convert ms to seconds)
-            delay = random.uniform(min_delay / 1000, max_delay / 1000)
+        if clear:
+            # clear() is meant for <input> and is unreliable on contenteditable divs;
+            # Keys.NULL releases Ctrl so the whole sequence is a single command
+            element.send_keys(Keys.CONTROL, 'a', Keys.NULL, Keys.DELETE)
+        
+        if self.fast_type and len(text) > 1:
+            rest = text
+            if ord(text[0]) <= MAX_KEYSTROKE_CODEPOINT:
+                element.send_keys(text[0])
+                rest = text[1:]
+            # Inserts at the focused element through Chrome's input pipeline,
+            # which WhatsApp's composer handles like typed text
+            self.driver.execute_cdp_cmd('Input.insertText', {'text': rest})
+            return
+        
+        # Draw all keystroke delays up front (convert ms to seconds)
+        uniform = self._rng.uniform
+        low, high = min_delay / 1000, max_delay / 1000
+        delays = [uniform(low, high) for _ in text]
+        
+        for char, delay in zip(text, delays):
+            if ord(char) <= MAX_KEYSTROKE_CODEPOINT:
+                element.send_keys(char)
+            else:
+                self.driver.execute_cdp_cmd('Input.insertText', {'text': char})
             time.sleep(delay)
     
-    def search_contact(self, phone_number):
+    def open_chat(self, phone_number):
         """
-        Search for a contact by phone number.
+        Open the chat with a phone number through WhatsApp's click-to-chat link.
         
         Args:
-            phone_number (str): Phone number to search for
+            phone_number (str): Phone number to open the chat for
             
         Returns:
-            bool: True if contact found, False otherwise
+            bool: True if the chat opened, False if the number is invalid
+            
+        Raises:
+            TimeoutException: If the chat neither opens nor is reported invalid in time
         """
-        try:
-            # Find the search box (data-tab='3' is the search input)
-            search_box = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true' and @data-tab='3']"))
-            )
+        # A new chat is about to open, so the old message box is no longer valid
+        self._message_box = None
+        
+        self.driver.get(build_chat_url(phone_number))
+        
+        # Either the composer appears or WhatsApp reports the number as invalid
+        element = self.chat_wait.until(EC.any_of(
+            EC.element_to_be_clickable(MESSAGE_BOX),
+            lambda driver: self._invalid_number_shown()
+        ))
+        if element is True:
+            return False
+        
+        self._message_box = element
+        return True
+    
+    def open_broadcast(self, list_name):
+        """
+        Open an existing broadcast list chat by searching for its name.
+        
+        Args:
+            list_name (str): Name of the broadcast list as shown in the chat list
             
-            # Clear and search for the phone number
+        Returns:
+            bool: True if the broadcast chat opened, False otherwise
+        """
+        # A new chat is about to open, so the old message box is no longer valid
+        self._message_box = None
+        
+        try:
+            search_box = self.short_wait.until(EC.element_to_be_clickable(SEARCH_BOX))
             search_box.click()
-            time.sleep(0.5)
-            search_box.clear()
-            time.sleep(0.3)
-            
-            # Type phone number
-            self.human_type(search_box, phone_number)
-            time.sleep(1.5)  # Wait for search results
+            self.human_type(search_box, list_name, clear=True)
             
-            # Press Enter to select the first search result
-            # This works even when contact shows name instead of phone number
+            # Select the first search result and wait for the chat to open
+            self.short_wait.until(EC.presence_of_element_located(SEARCH_RESULT))
             search_box.send_keys(Keys.RETURN)
-            time.sleep(2)  # Wait for chat to open
             
-            # Verify that chat was opened by checking if message box is available
-            # This confirms the contact was found and selected
+            # The previous chat's header and footer stay up until the new chat
+            # renders, and the first result may be a contact, group or message
+            # hit, so wait until the open conversation is the broadcast list
             try:
-                # Check if message input box appears (indicates chat is open)
-                self.driver.find_element(
-                    By.XPATH,
-                    "//div[@contenteditable='true' and (@data-tab='10' or @data-tab='1' or @role='textbox')]"
-                )
-                return True
-            except NoSuchElementException:
-                # Chat didn't open, contact might not exist
-                # Try to clear search and return False
-                try:
-                    search_box.clear()
-                    time.sleep(0.5)
-                    search_box.send_keys(Keys.ESCAPE)  # Close search if possible
-                except:
-                    pass
+                self.short_wait.until(lambda driver: self._chat_title() == list_name)
+            except TimeoutException:
+                print(f"  ✗ Broadcast list '{list_name}' not found (open chat is '{self._chat_title()}')")
                 return False
-                
+            
+            self._message_box = self.short_wait.until(EC.element_to_be_clickable(MESSAGE_BOX))
+            return True
+            
         except TimeoutException:
-            print(f"  ✗ Timeout while searching for {phone_number}")
+            print(f"  ✗ Timeout while opening broadcast list '{list_name}'")
             return False
         except Exception as e:
-            print(f"  ✗ Error searching for {phone_number}: {str(e)}")
+            print(f"  ✗ Error opening broadcast list '{list_name}': {str(e)}")
             return False
     
+    def _type_and_send(self, message):
+        """Type a message into the open chat, press Enter and wait until it is sent."""
+        # Reuse the message box found while opening the chat
+        message_box = self._resolve('_message_box', MESSAGE_BOX)
+        
+        # Type the message with human-like delays, replacing any draft WhatsApp
+        # kept for this chat (e.g. from an earlier attempt whose Enter failed)
+        message_box.click()
+        self.human_type(message_box, message, clear=True)
+        
+        # Send the message (press Enter) and wait until WhatsApp takes it. A bubble
+        # count would also rise for incoming messages and history still rendering
+        message_box.send_keys(Keys.RETURN)
+        self.short_wait.until(lambda driver: self._composer_empty())
+    
     def send_message(self, phone_number, message):
         """
         Send a message to a contact.
@@ -169,94 +583,58 @@ class WhatsAppBulkSender:
             bool: True if message sent successfully, False otherwise
         """
         try:
-            # Search for the contact
-            if not self.search_contact(phone_number):
-                print(f"  ✗ Contact {phone_number} not found")
+            # Open the chat directly
+            if not self.open_chat(phone_number):
+                print(f"  ✗ Phone number {phone_number} is invalid")
                 return False
             
-            # Find the message input box (data-tab='10' or '1' depending on WhatsApp version)
-            try:
-                message_box = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true' and @data-tab='10']"))
-                )
-            except TimeoutException:
-                # Try alternative selector
-                try:
-                    message_box = self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true' and @data-tab='1']"))
-                    )
-                except TimeoutException:
-                    # Last resort: find any contenteditable div in the message area
-                    message_box = self.driver.find_element(
-                        By.XPATH,
-                        "//div[@contenteditable='true' and @role='textbox']"
-                    )
-            
-            # Type the message with human-like delays
-            message_box.click()
-            time.sleep(0.3)
-            self.human_type(message_box, message)
-            time.sleep(0.5)
-            
-            # Send the message (press Enter)
-            message_box.send_keys(Keys.RETURN)
-            time.sleep(1)
+            self._type_and_send(message)
             
             print(f"  ✓ Message sent to {phone_number}")
             return True
             
         except TimeoutException:
+            # Covers a chat that did not load as well as a message that did not go out
             print(f"  ✗ Timeout while sending message to {phone_number}")
             return False
         except Exception as e:
             print(f"  ✗ Error sending message to {phone_number}: {str(e)}")
             return False
     
-    def send_bulk_messages(self, phone_numbers, message, delay_min=2, delay_max=5):
+    def send_broadcasts(self, list_names, message):
         """
-        Send messages to multiple phone numbers.
+        Send one message to each of several broadcast lists.
+        
+        Each list fans the message out to up to 256 recipients, so a single
+        send replaces one chat per recipient.
         
         Args:
-            phone_numbers (list): List of phone numbers
-            message (str): Message to send to all contacts
-            delay_min (int): Minimum delay between messages in seconds
-            delay_max (int): Maximum delay between messages in seconds
+            list_names (list): Names of existing broadcast lists
+            message (str): Message to send
         """
-        total = len(phone_numbers)
-        print(f"\n📱 Starting bulk message sending to {total} contacts...")
+        total = len(list_names)
+        print(f"\n📢 Starting broadcast to {total} list(s)...")
         print(f"Message: {message[:50]}{'...' if len(message) > 50 else ''}\n")
         
-        for i, phone_number in enumerate(phone_numbers, 1):
-            phone_number = phone_number.strip()
-            if not phone_number:
-                continue
-            
-            print(f"[{i}/{total}] Processing {phone_number}...")
-            
-            success = self.send_message(phone_number, message)
-            
-            if success:
-                self.results['success'].append(phone_number)
-            else:
-                self.results['failed'].append(phone_number)
+        for i, list_name in enumerate(list_names, 1):
+            self._wait_for_rate_limit()
+            print(f"[{i}/{total}] Processing broadcast list '{list_name}'...")
             
-            # Random delay between messages (except for the last one)
-            if i < total:
-                delay = random.uniform(delay_min, delay_max)
-                print(f"  Waiting {delay:.1f} seconds before next message...\n")
-                time.sleep(delay)
-        
-        # Print summary
-        print("\n" + "="*50)
-        print("📊 SUMMARY")
-        print("="*50)
-        print(f"✓ Successfully sent: {len(self.results['success'])}")
-        print(f"✗ Failed: {len(self.results['failed'])}")
-        
-        if self.results['failed']:
-            print("\nFailed numbers:")
-            for number in self.results['failed']:
-                print(f"  - {number}")
+            try:
+                if not self.open_broadcast(list_name):
+                    self._record(list_name, False)
+                else:
+                    self._type_and_send(message)
+                    print(f"  ✓ Message sent to broadcast list '{list_name}'")
+                    self._record(list_name, True)
+            except TimeoutException:
+                print(f"  ✗ Timeout while sending message to broadcast list '{list_name}'")
+                self._record(list_name, False)
+            except Exception as e:
+                print(f"  ✗ Error sending message to broadcast list '{list_name}': {str(e)}")
+                self._record(list_name, False)
+        
+        self.print_summary()
     
     def cleanup(self):
         """Close the browser and cleanup resources."""
@@ -266,10 +644,277 @@ class WhatsAppBulkSender:
             print("✓ Cleanup complete")
 
 
+class WhatsAppProtocolSender(BulkSender):
+    """
+    Sends messages over the WhatsApp Web protocol through a Baileys sidecar.
+    
+    No browser is involved: the Node sidecar keeps a WebSocket to WhatsApp and
+    each message is one JSON request/response line over its stdin/stdout.
+    """
+    
+    def __init__(self, sidecar=DEFAULT_SIDECAR, auth_dir=DEFAULT_AUTH_DIR, rate_limiter=None):
+        """
+        Initialize the protocol sender.
+        
+        Args:
+            sidecar (Path): Node script implementing the sidecar protocol
+                (default: sidecar/baileys_sidecar.js)
+            auth_dir (Path): Directory where the sidecar keeps its login state
+                (default: ~/.cache/wa-bulk/baileys-auth)
+            rate_limiter (TokenBucket): Limits how fast messages are sent
+                (default: 20 per minute with bursts of 5)
+        """
+        super().__init__(rate_limiter)
+        self.sidecar = Path(sidecar)
+        self.auth_dir = Path(auth_dir)
+        self.process = None
+        self._request_id = 0
+        # Lines read from the sidecar's stdout, None once it exits
+        self._lines = queue.Queue()
+    
+    def _read_stdout(self, stdout):
+        """Forward the sidecar's stdout lines to the queue (runs in a thread)."""
+        for line in stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+    
+    def _read_reply(self, timeout, match):
+        """
+        Wait for the next sidecar reply accepted by `match`.
+        
+        Lines that are not JSON objects or that `match` rejects (stray log
+        output, answers to requests that already timed out) are skipped.
+        
+        Args:
+            timeout (float): Seconds to wait for the reply
+            match (callable): Returns True for the expected reply
+            
+        Returns:
+            dict: The reply
+            
+        Raises:
+            TimeoutError: If no matching reply arrives in time
+            EOFError: If the sidecar exited
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"no reply from the sidecar within {timeout} seconds")
+            if line is None:
+                # Keep the marker so later reads fail fast too
+                self._lines.put(None)
+                raise EOFError("sidecar exited")
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(reply, dict) and match(reply):
+                return reply
+    
+    def start(self):
+        """Start the sidecar and wait until it is connected to WhatsApp."""
+        print("\nStarting WhatsApp protocol sidecar...")
+        self.auth_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            # stderr is left on the terminal so the login QR code is visible
+            self.process = subprocess.Popen(
+                ['node', str(self.sidecar), str(self.auth_dir)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                bufsize=1
+            )
+        except FileNotFoundError:
+            print("✗ Error: Node.js is required for the protocol backend.")
+            return False
+        threading.Thread(target=self._read_stdout, args=(self.process.stdout,), daemon=True).start()
+        
+        print("If a QR code is shown, scan it with your WhatsApp mobile app.")
+        try:
+            self._read_reply(QR_TIMEOUT, lambda reply: reply.get('event') == 'ready')
+        except TimeoutError:
+            print(f"✗ Timeout: the sidecar did not connect within {QR_TIMEOUT} seconds.")
+            return False
+        except EOFError:
+            print("✗ The sidecar could not connect to WhatsApp.")
+            return False
+        
+        print("✓ Connected to WhatsApp.")
+        return True
+    
+    def send_message(self, phone_number, message):
+        """
+        Send a message to a contact through the sidecar.
+        
+        Args:
+            phone_number (str): Phone number of the recipient
+            message (str): Message to send
+            
+        Returns:
+            bool: True if message sent successfully, False otherwise
+        """
+        self._request_id += 1
+        request = {
+            'id': self._request_id,
+            'phone': re.sub(r'\D', '', phone_number),
+            'message': message
+        }
+        try:
+            self.process.stdin.write(json.dumps(request) + '\n')
+            self.process.stdin.flush()
+            reply = self._read_reply(
+                SIDECAR_REPLY_TIMEOUT,
+                lambda reply: reply.get('id') == request['id']
+            )
+        except (OSError, TimeoutError, EOFError) as e:
+            print(f"  ✗ Error sending message to {phone_number}: {str(e)}")
+            return False
+        
+        if not reply.get('ok'):
+            print(f"  ✗ Error sending message to {phone_number}: {reply.get('error', 'unknown error')}")
+            return False
+        
+        print(f"  ✓ Message sent to {phone_number}")
+        return True
+    
+    def cleanup(self):
+        """Stop the sidecar."""
+        if self.process:
+            print("\nStopping sidecar...")
+            # Closing stdin asks the sidecar to exit
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+            self.process = None
+            print("✓ Cleanup complete")
+
+
+class SendJobHandler(socketserver.StreamRequestHandler):
+    """Runs one JSON send job from a client on the daemon's logged-in sender."""
+    
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # Connection probe without a job
+            return
+        try:
+            job = json.loads(line)
+            sender = self.server.sender
+            # Report only this job's outcomes to the client
+            sender.results = {
+                'success': [],
+                'failed': []
+            }
+            run_job(sender, job)
+            reply = {'ok': True, 'results': sender.results}
+        except Exception as e:
+            print(f"✗ Error running job: {str(e)}")
+            reply = {'ok': False, 'error': str(e)}
+        self.wfile.write((json.dumps(reply) + '\n').encode('utf-8'))
+
+
+def run_job(sender, job):
+    """
+    Run one send job on a started sender.
+    
+    Args:
+        sender (BulkSender): Sender that is already logged in
+        job (dict): 'message' plus either 'broadcast' (list names) or 'numbers',
+            with an optional 'checkpoint'
+    """
+    if job.get('broadcast'):
+        # Jobs from --socket clients may target a daemon with another backend
+        if not hasattr(sender, 'send_broadcasts'):
+            raise ValueError(f"{type(sender).__name__} does not support broadcast lists")
+        # Send once per broadcast list
+        sender.send_broadcasts(job['broadcast'], job['message'])
+    else:
+        # Send bulk messages
+        sender.send_bulk_messages(
+            job['numbers'],
+            job['message'],
+            checkpoint_path=job.get('checkpoint')
+        )
+
+
+def serve(sender, socket_path):
+    """
+    Serve send jobs over a UNIX socket until interrupted.
+    
+    Args:
+        sender (BulkSender): Sender that is already logged in
+        socket_path (str): Path of the UNIX socket to listen on
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        # Never delete something that is not a socket, e.g. a mistyped file path
+        if not stat.S_ISSOCK(socket_path.stat().st_mode):
+            raise RuntimeError(f"'{socket_path}' exists and is not a socket")
+        # Only replace the socket if no daemon is answering on it
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(socket_path))
+            raise RuntimeError(f"a daemon is already listening on '{socket_path}'")
+        except ConnectionRefusedError:
+            socket_path.unlink()
+    
+    with socketserver.UnixStreamServer(str(socket_path), SendJobHandler) as server:
+        server.sender = sender
+        print(f"\n✓ Waiting for jobs on '{socket_path}' (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink()
+
+
+def send_to_daemon(socket_path, job):
+    """
+    Send a job to a running daemon and wait for its outcome.
+    
+    Args:
+        socket_path (str): Path of the daemon's UNIX socket
+        job (dict): Job as accepted by `run_job`
+        
+    Returns:
+        dict: Reply with 'ok' and either 'results' or 'error'
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall((json.dumps(job) + '\n').encode('utf-8'))
+        with client.makefile('r', encoding='utf-8') as reply:
+            return json.loads(reply.readline())
+
+
+def print_results(results):
+    """Print success/failure statistics for a results dict."""
+    print("\n" + "="*50)
+    print("📊 SUMMARY")
+    print("="*50)
+    print(f"✓ Successfully sent: {len(results['success'])}")
+    print(f"✗ Failed: {len(results['failed'])}")
+    
+    if results['failed']:
+        print("\nFailed recipients:")
+        for number in results['failed']:
+            print(f"  - {number}")
+
+
 def read_phone_numbers(file_path):
     """
     Read phone numbers from a text file.
     
+    The file is read in one go and matched as bytes, so large lists are parsed
+    without decoding every line. Spaces, dashes, dots and parentheses are removed
+    from each number; lines that are not valid phone numbers are skipped.
+    
     Args:
         file_path (str): Path to the phone numbers file
         
@@ -277,8 +922,16 @@ def read_phone_numbers(file_path):
         list: List of phone numbers
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            numbers = [line.strip() for line in f if line.strip()]
+        # Files saved by spreadsheet apps and Notepad often start with a UTF-8 BOM
+        data = Path(file_path).read_bytes()
+        if data.startswith(codecs.BOM_UTF8):
+            data = data[len(codecs.BOM_UTF8):]
+        lines = [line.strip().translate(None, PHONE_NUMBER_SEPARATORS) for line in data.splitlines()]
+        numbers = [line.decode('ascii') for line in lines if PHONE_NUMBER_PATTERN.match(line)]
+        
+        skipped = sum(1 for line in lines if line) - len(numbers)
+        if skipped:
+            print(f"⚠ Skipped {skipped} invalid line(s) in '{file_path}'")
         return numbers
     except FileNotFoundError:
         print(f"✗ Error: File '{file_path}' not found.")
@@ -288,6 +941,90 @@ def read_phone_numbers(file_path):
         sys.exit(1)
 
 
+def read_checkpoint(file_path):
+    """
+    Read the phone numbers already sent successfully from a checkpoint file.
+    
+    Args:
+        file_path (str): Path to the JSONL checkpoint file
+        
+    Returns:
+        set: Phone numbers with a successful entry
+    """
+    sent = set()
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash
+                    continue
+                # Ignore lines that are valid JSON but not checkpoint entries
+                if isinstance(entry, dict) and entry.get('ok') and 'phone' in entry:
+                    sent.add(entry['phone'])
+    except FileNotFoundError:
+        pass
+    return sent
+
+
+def build_chat_url(phone_number):
+    """
+    Build a WhatsApp Web click-to-chat URL for a phone number.
+    
+    Args:
+        phone_number (str): Phone number in international format
+        
+    Returns:
+        str: URL that opens the chat directly
+    """
+    digits = re.sub(r'\D', '', phone_number)
+    return f"https://web.whatsapp.com/send?phone={digits}"
+
+
+def parse_rate(value):
+    """
+    Parse a send rate such as '20/min', '1/s' or '600/h' into messages per minute.
+    
+    A bare number is taken as messages per minute.
+    
+    Args:
+        value (str): Rate given on the command line
+        
+    Returns:
+        float: Messages per minute
+    """
+    count, _, unit = value.partition('/')
+    per_minute = {'': 1, 's': 60, 'sec': 60, 'm': 1, 'min': 1, 'h': 1 / 60, 'hour': 1 / 60}
+    try:
+        rate = float(count) * per_minute[unit.strip().lower()]
+    except (ValueError, KeyError):
+        raise argparse.ArgumentTypeError(f"invalid rate '{value}', expected e.g. 20/min")
+    # nan passes the comparison below and would switch rate limiting off
+    if not math.isfinite(rate) or rate <= 0:
+        raise argparse.ArgumentTypeError(f"rate must be a positive number, got '{value}'")
+    return rate
+
+
+def parse_burst(value):
+    """
+    Parse the burst size given on the command line.
+    
+    Args:
+        value (str): Burst size given on the command line
+        
+    Returns:
+        int: Number of messages that may be sent back to back
+    """
+    try:
+        burst = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid burst '{value}', expected a whole number")
+    if burst <= 0:
+        raise argparse.ArgumentTypeError(f"burst must be positive, got '{value}'")
+    return burst
+
+
 def main():
     """Main function to run the WhatsApp bulk sender."""
     parser = argparse.ArgumentParser(
@@ -297,19 +1034,54 @@ def main():
 Examples:
   python whatsapp_bulk_sender.py --numbers phone_numbers.txt --message "Hello!"
   python whatsapp_bulk_sender.py -n numbers.txt -m "Test message" --headless
+  python whatsapp_bulk_sender.py --broadcast "Customers" -m "Hello everyone!"
+  python whatsapp_bulk_sender.py -n numbers.txt -m "Hello!" --backend protocol
+  python whatsapp_bulk_sender.py --serve /tmp/wa.sock
+  python whatsapp_bulk_sender.py --socket /tmp/wa.sock -n numbers.txt -m "Hello!"
         """
     )
     
     parser.add_argument(
         '-n', '--numbers',
-        required=True,
         help='Path to text file containing phone numbers (one per line)'
     )
     
+    parser.add_argument(
+        '--broadcast',
+        action='append',
+        metavar='LIST_NAME',
+        help='Send once to an existing broadcast list instead of each number; repeat for several lists'
+    )
+    
     parser.add_argument(
         '-m', '--message',
-        required=True,
-        help='Message to send to all contacts'
+        help='Message to send to all contacts (required unless --serve is used)'
+    )
+    
+    daemon = parser.add_mutually_exclusive_group()
+    daemon.add_argument(
+        '--serve',
+        metavar='SOCKET',
+        help='Log in once and keep running, accepting jobs from --socket clients on this UNIX socket'
+    )
+    daemon.add_argument(
+        '--socket',
+        metavar='SOCKET',
+        help='Hand the job to a daemon started with --serve instead of starting a browser'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=['selenium', 'protocol'],
+        default='selenium',
+        help='Send through WhatsApp Web in Chrome (selenium) or the Baileys protocol sidecar (protocol) (default: selenium)'
+    )
+    
+    parser.add_argument(
+        '--auth-dir',
+        type=Path,
+        default=DEFAULT_AUTH_DIR,
+        help='Directory where the protocol sidecar keeps its login (default: ~/.cache/wa-bulk/baileys-auth)'
     )
     
     parser.add_argument(
@@ -319,54 +1091,122 @@ Examples:
     )
     
     parser.add_argument(
-        '--delay-min',
-        type=int,
-        default=2,
-        help='Minimum delay between messages in seconds (default: 2)'
+        '--human-type',
+        action='store_true',
+        help='Type every character with a random delay instead of inserting text at once'
     )
     
     parser.add_argument(
-        '--delay-max',
-        type=int,
-        default=5,
-        help='Maximum delay between messages in seconds (default: 5)'
+        '--refresh-driver',
+        action='store_true',
+        help='Check for a new ChromeDriver instead of reusing the cached one'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--profile-dir',
+        type=Path,
+        default=DEFAULT_PROFILE_DIR,
+        help='Chrome profile directory that keeps the WhatsApp Web login between runs (default: ~/.cache/wa-bulk/profile)'
+    )
     
-    # Validate phone numbers file exists
-    if not Path(args.numbers).exists():
-        print(f"✗ Error: Phone numbers file '{args.numbers}' not found.")
-        sys.exit(1)
+    parser.add_argument(
+        '--checkpoint',
+        metavar='FILE',
+        help='JSONL file recording each send; numbers already sent according to it are skipped on rerun'
+    )
     
-    # Read phone numbers
-    phone_numbers = read_phone_numbers(args.numbers)
+    parser.add_argument(
+        '--rate',
+        type=parse_rate,
+        default=DEFAULT_RATE_PER_MIN,
+        help=f'Steady send rate such as 20/min, 1/s or 600/h (default: {DEFAULT_RATE_PER_MIN}/min)'
+    )
     
-    if not phone_numbers:
-        print("✗ Error: No phone numbers found in the file.")
-        sys.exit(1)
+    parser.add_argument(
+        '--burst',
+        type=parse_burst,
+        default=DEFAULT_BURST,
+        help=f'Number of messages that may be sent back to back before the rate applies (default: {DEFAULT_BURST})'
+    )
+    
+    args = parser.parse_args()
+    
+    if not args.serve:
+        if not args.message:
+            parser.error('the following arguments are required: -m/--message')
+        if not args.numbers and not args.broadcast:
+            parser.error('one of --numbers or --broadcast is required')
+        if args.numbers and args.broadcast:
+            parser.error('--numbers cannot be used with --broadcast')
+    if args.backend == 'protocol' and args.broadcast:
+        parser.error('--broadcast is only supported by the selenium backend')
+    if args.broadcast and args.checkpoint:
+        parser.error('--checkpoint cannot be used with --broadcast')
+    
+    job = None
+    if not args.serve:
+        phone_numbers = []
+        if not args.broadcast:
+            # Validate phone numbers file exists
+            if not Path(args.numbers).exists():
+                print(f"✗ Error: Phone numbers file '{args.numbers}' not found.")
+                sys.exit(1)
+            
+            # Read phone numbers
+            phone_numbers = read_phone_numbers(args.numbers)
+            
+            if not phone_numbers:
+                print("✗ Error: No phone numbers found in the file.")
+                sys.exit(1)
+            
+            print(f"✓ Loaded {len(phone_numbers)} phone numbers from '{args.numbers}'")
+        
+        job = {
+            'numbers': phone_numbers,
+            'broadcast': args.broadcast,
+            'message': args.message,
+            # The daemon may run from another directory
+            'checkpoint': str(Path(args.checkpoint).resolve()) if args.checkpoint else None
+        }
     
-    print(f"✓ Loaded {len(phone_numbers)} phone numbers from '{args.numbers}'")
+    if args.socket:
+        # Hand the job to the running daemon instead of starting a browser
+        try:
+            reply = send_to_daemon(args.socket, job)
+        except (OSError, ValueError) as e:
+            print(f"✗ Error: Could not reach daemon at '{args.socket}': {str(e)}")
+            sys.exit(1)
+        if not reply.get('ok'):
+            print(f"✗ Daemon error: {reply.get('error')}")
+            sys.exit(1)
+        print_results(reply['results'])
+        return
     
     # Initialize sender
-    sender = WhatsAppBulkSender(headless=args.headless)
+    rate_limiter = TokenBucket(args.rate, args.burst)
+    if args.backend == 'protocol':
+        sender = WhatsAppProtocolSender(auth_dir=args.auth_dir, rate_limiter=rate_limiter)
+    else:
+        sender = WhatsAppBulkSender(
+            headless=args.headless,
+            fast_type=not args.human_type,
+            profile_dir=args.profile_dir,
+            rate_limiter=rate_limiter,
+            refresh_driver=args.refresh_driver
+        )
     
     try:
-        # Setup and open WhatsApp Web
-        sender.setup_driver()
-        
-        if not sender.open_whatsapp_web():
-            print("✗ Failed to login to WhatsApp Web. Exiting.")
+        # Connect and log in to WhatsApp
+        if not sender.start():
+            print("✗ Failed to login to WhatsApp. Exiting.")
             sender.cleanup()
             sys.exit(1)
         
-        # Send bulk messages
-        sender.send_bulk_messages(
-            phone_numbers,
-            args.message,
-            delay_min=args.delay_min,
-            delay_max=args.delay_max
-        )
+        if args.serve:
+            # Keep the logged-in sender alive for jobs from clients
+            serve(sender, args.serve)
+        else:
+            run_job(sender, job)
         
     except KeyboardInterrupt:
         print("\n\n⚠ Interrupted by user. Cleaning up...")